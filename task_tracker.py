@@ -0,0 +1,449 @@
+import os
+import sys
+import zlib
+import errno
+import base64
+import hashlib
+import argparse
+import tempfile
+import queue
+import atexit
+import logging
+import logging.handlers
+from datetime import datetime
+import orjson
+from cryptography.fernet import Fernet, InvalidToken
+from cryptography.exceptions import InvalidTag
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+LOG_FILE = "task_tracker.log"
+KEY_FILE = "encryption_key.key"
+FILE = "tasks.json"
+NONCE_SIZE = 12  # 96-bit nonce, the recommended size for AES-GCM
+FORMAT_VERSION = b"\x02"  # First byte of the file: AES-GCM over zlib-compressed JSON
+TAG_SIZE = 16  # AES-GCM authentication tag appended to the ciphertext
+FERNET_PREFIX = b"gAAAAA"  # Start of a Fernet token, the format used before AES-GCM
+COMPRESSION_LEVEL = 1  # Fastest zlib level; task JSON compresses well even at this level
+BACKUP_FOLDER = "backups/"
+LATEST_BACKUP_FILE = os.path.join(BACKUP_FOLDER, ".latest")  # Digest of the most recent backup
+BACKUP_INTERVAL = 10  # Take an automatic backup on the first save and then every N saves
+
+_CIPHER = None  # Cached AESGCM instance, see get_cipher()
+_save_count = 0  # Saves made by this process, see save_tasks()
+_tasks_cache = None  # (file signature, decrypted JSON) of the last load or save, see load_tasks()
+_use_key_file = False  # Set by --key-file, see load_key()
+_integrity_failed = False  # Set when tasks.json fails to decrypt, see save_tasks()
+
+# Setup logging configuration
+# Records are queued and written to the log file by a background listener thread
+def setup_logging():
+    log_queue = queue.Queue(-1)
+    log_file_handler = logging.FileHandler(LOG_FILE)
+    log_file_handler.setFormatter(logging.Formatter("%(asctime)s - %(levelname)s - %(message)s"))
+    log_listener = logging.handlers.QueueListener(log_queue, log_file_handler)
+    logging.getLogger().setLevel(logging.INFO)
+    logging.getLogger().addHandler(logging.handlers.QueueHandler(log_queue))
+    log_listener.start()
+    atexit.register(log_listener.stop)  # Flush queued records on exit
+
+# Generate and save encryption key (owner-only, never left half-written, never replacing a key)
+def generate_key():
+    key = base64.urlsafe_b64encode(AESGCM.generate_key(bit_length=256))
+    tmp_path, _ = write_temp_file(KEY_FILE, key)
+    try:
+        # Unlike os.replace, fails if the key file already exists (also where it falls back to an O_EXCL write)
+        link_or_copy(tmp_path, KEY_FILE, key)
+    except FileExistsError:
+        logging.warning(f"Encryption key {KEY_FILE} was created by another run. Using that key.")
+        return
+    finally:
+        os.unlink(tmp_path)
+    fsync_directory(os.path.dirname(KEY_FILE) or ".")
+    logging.info(f"Encryption key created: {KEY_FILE}")
+
+# Load encryption key from the key file, generating one if it does not exist
+def load_key_file():
+    if not os.path.exists(KEY_FILE):
+        logging.warning("Encryption key not found. Generating new key...")
+        generate_key()
+    else:
+        logging.info(f"Encryption key loaded from {KEY_FILE}")
+    with open(KEY_FILE, 'rb') as key_file:
+        return key_file.read()
+
+# Load encryption key from environment variable (or the key file with --key-file)
+def load_key():
+    if _use_key_file:
+        return load_key_file()
+    key = os.getenv("ENCRYPTION_KEY")
+    if not key:
+        raise ValueError("ENCRYPTION_KEY environment variable not set")
+    return key.encode()  # Base64-encoded 256-bit AES key
+
+# Build the AES-256-GCM instance once per process and reuse it
+def get_cipher():
+    global _CIPHER
+    if _CIPHER is None:
+        key = base64.urlsafe_b64decode(load_key())
+        # AESGCM also accepts 16- and 24-byte keys, which Fernet (used for old files) rejects
+        if len(key) != 32:
+            raise ValueError("Encryption key must be 32 url-safe base64-encoded bytes (AES-256)")
+        _CIPHER = AESGCM(key)
+    return _CIPHER
+
+# Compress and encrypt data (bytes) before saving
+def encrypt_data(data):
+    nonce = os.urandom(NONCE_SIZE)
+    encrypted = FORMAT_VERSION + nonce + get_cipher().encrypt(nonce, zlib.compress(data, COMPRESSION_LEVEL), None)
+    return encrypted
+
+# Decrypt and decompress data (returned as bytes) after loading
+def decrypt_data(encrypted_data):
+    # Files written before the switch to AES-GCM are Fernet tokens under the same key
+    if encrypted_data.startswith(FERNET_PREFIX):
+        return Fernet(load_key()).decrypt(encrypted_data)
+    if encrypted_data[:1] != FORMAT_VERSION:
+        raise InvalidTag()  # Not written in this format
+    if len(encrypted_data) < 1 + NONCE_SIZE + TAG_SIZE:
+        raise InvalidTag()  # Too short to hold a nonce and tag
+    # The file holds version || nonce || ciphertext || tag; split it without copying the ciphertext
+    view = memoryview(encrypted_data)
+    nonce, ciphertext = view[1:NONCE_SIZE + 1], view[NONCE_SIZE + 1:]
+    decrypted = zlib.decompress(get_cipher().decrypt(nonce, ciphertext, None))
+    return decrypted
+
+# Secure file creation with restrictive permissions
+def secure_file_creation(filepath):
+    if not os.path.exists(filepath):
+        # A zero-length file loads as an empty task list, so creating it needs no encryption
+        os.close(os.open(filepath, os.O_WRONLY | os.O_CREAT, 0o600))
+        logging.info(f"File created with secure permissions: {filepath}")
+
+# Write all of data to an open file descriptor and fsync it
+def write_fd(fd, data):
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+    os.fsync(fd)
+
+# Write data to a new, uniquely named temp file (mode 0600) next to filepath and fsync it
+# Returns the temp file path and its os.stat_result; the temp file is removed if writing fails
+def write_temp_file(filepath, data):
+    directory, name = os.path.split(filepath)
+    fd, tmp_path = tempfile.mkstemp(dir=directory or ".", prefix=f"{name}.", suffix=".tmp")
+    try:
+        try:
+            write_fd(fd, data)
+            stat = os.fstat(fd)
+        finally:
+            os.close(fd)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return tmp_path, stat
+
+# Write data to a new file that must not exist yet (mode 0600) and fsync it
+# Raises FileExistsError instead of overwriting
+def write_file_exclusive(filepath, data):
+    fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    try:
+        write_fd(fd, data)
+    finally:
+        os.close(fd)
+
+# Flush a directory entry change (rename or link) to disk where the platform allows it
+def fsync_directory(dirpath):
+    if not hasattr(os, "O_DIRECTORY"):
+        return  # Directories cannot be opened for fsync on Windows
+    fd = os.open(dirpath, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+# Write data to a temp file, then atomically replace the target
+# Both the data and the rename are fsynced so a power loss cannot leave an empty file behind
+# Returns the os.stat_result of the written file, taken before the rename so no other run can interfere
+def write_file_atomic(filepath, data):
+    tmp_path, stat = write_temp_file(filepath, data)
+    os.replace(tmp_path, filepath)  # Keeps the inode and mtime, so stat still describes filepath
+    fsync_directory(os.path.dirname(filepath) or ".")
+    return stat
+
+# Hard link src to a new path dst, writing data (the contents of src) where hard links are not supported
+# Never overwrites: raises FileExistsError if dst already exists
+def link_or_copy(src, dst, data):
+    try:
+        os.link(src, dst)
+    except OSError as error:
+        if error.errno not in (errno.EXDEV, errno.EPERM, errno.ENOTSUP):
+            raise
+        write_file_exclusive(dst, data)
+
+# Create a timestamped backup of the tasks.json file, skipped if unchanged since the last backup
+# A hard link shares its inode with tasks.json, and tasks.json can be rewritten in place (by tracker.py,
+# or by a manual restore), so hard_link is only for save_tasks, which replaces the file right afterwards
+def create_backup(hard_link=False):
+    if not os.path.exists(BACKUP_FOLDER):
+        os.makedirs(BACKUP_FOLDER)
+    with open(FILE, 'rb') as file:
+        data = file.read()
+    digest = hashlib.blake2b(data).hexdigest()
+    if os.path.exists(LATEST_BACKUP_FILE):
+        with open(LATEST_BACKUP_FILE, 'r') as latest_file:
+            if latest_file.read() == digest:
+                logging.info("Backup skipped: tasks unchanged since the last backup.")
+                return None
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+    backup_file = os.path.join(BACKUP_FOLDER, f"tasks_{timestamp}.json")
+    counter = 1
+    while True:
+        try:
+            if hard_link:
+                link_or_copy(FILE, backup_file, data)
+            else:
+                write_file_exclusive(backup_file, data)
+            break
+        except FileExistsError:
+            backup_file = os.path.join(BACKUP_FOLDER, f"tasks_{timestamp}_{counter}.json")
+            counter += 1
+    write_file_atomic(LATEST_BACKUP_FILE, digest.encode())
+    logging.info(f"Backup created: {backup_file}")
+    return backup_file
+
+# Identify a version of a file from its stat result by inode, modification time and size
+def file_signature(stat):
+    return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+# Load tasks from JSON file (decrypt and verify integrity)
+# AES-GCM authenticates the ciphertext with its GHASH tag, so a tampered file fails to decrypt
+# The decrypted JSON is cached and reused until the file on disk changes
+# Fernet files are re-saved in the current format once they decrypt successfully
+def load_tasks():
+    global _tasks_cache, _integrity_failed
+    secure_file_creation(FILE)
+    # Read the small file with a single unbuffered read sized from fstat
+    fd = os.open(FILE, os.O_RDONLY)
+    try:
+        stat = os.fstat(fd)
+        signature = file_signature(stat)
+        if _tasks_cache and _tasks_cache[0] == signature:
+            return orjson.loads(_tasks_cache[1])
+        encrypted_data = os.read(fd, stat.st_size)
+    finally:
+        os.close(fd)
+    _integrity_failed = False
+    if not encrypted_data:
+        return []
+    try:
+        decrypted_data = decrypt_data(encrypted_data)
+        tasks = orjson.loads(decrypted_data)
+    except (InvalidTag, InvalidToken, zlib.error, orjson.JSONDecodeError):
+        _integrity_failed = True
+        logging.error("Data integrity check failed! Possible tampering detected. Returning empty task list.")
+        return []
+    logging.info("Data integrity verified.")
+    if encrypted_data.startswith(FERNET_PREFIX):
+        logging.info("Converting tasks from the Fernet format to AES-GCM.")
+        save_tasks(tasks)
+        return tasks
+    _tasks_cache = (signature, decrypted_data)
+    return tasks
+
+# Save tasks to JSON file (periodic backup, encrypt and atomic write)
+# Returns False without writing if the file on disk failed its integrity check
+def save_tasks(tasks):
+    global _save_count, _tasks_cache
+    if _integrity_failed:
+        logging.error(f"Refusing to overwrite {FILE} after a failed integrity check.")
+        print(f"Error: {FILE} failed the integrity check and was not overwritten. Restore it from {BACKUP_FOLDER} first.")
+        return False
+    if _save_count % BACKUP_INTERVAL == 0:
+        create_backup(hard_link=True)
+    _save_count += 1
+    data = orjson.dumps(tasks)
+    encrypted_data = encrypt_data(data)
+    stat = write_file_atomic(FILE, encrypted_data)
+    _tasks_cache = (file_signature(stat), data)
+    logging.info("Tasks successfully saved and encrypted.")
+    return True
+
+# Add a new task with input validation
+def add_task():
+    title = input("Enter task title: ").strip()
+    if not title:
+        logging.error("Task title cannot be empty")
+        print("Error: Task title cannot be empty.")
+        return
+
+    description = input("Enter task description: ").strip()
+    if not description:
+        logging.error("Task description cannot be empty")
+        print("Error: Task description cannot be empty.")
+        return
+
+    tasks = load_tasks()
+    task = {"id": len(tasks) + 1, "title": title, "description": description, "status": "not done"}
+    tasks.append(task)
+    if not save_tasks(tasks):
+        return
+    logging.info(f"Task '{title}' added with ID {task['id']}")
+    print(f"Task '{title}' added.")
+
+# Display existing tasks
+def display_tasks():
+    tasks = load_tasks()
+    if not tasks:
+        logging.info("No tasks available to display.")
+        print("No tasks available.")
+        return
+    print("\nExisting Tasks:")
+    for task in tasks:
+        description = task.get('description', 'No description available')
+        print(f"ID: {task['id']}, Title: {task['title']}, Description: {description}, Status: {task['status']}")
+
+# Validate task ID input against an ID -> task index of the loaded tasks
+def get_valid_task_id(tasks_by_id):
+    while True:
+        try:
+            task_id = int(input("Enter task ID: ").strip())
+            if task_id not in tasks_by_id:
+                logging.error(f"Task ID {task_id} not found.")
+                print(f"Error: Task ID {task_id} does not exist.")
+            else:
+                return task_id
+        except ValueError:
+            logging.error("Invalid input for task ID. Numeric value required.")
+            print("Error: Please enter a valid numeric task ID.")
+
+# Update task status with input validation
+def update_task_status():
+    tasks = load_tasks()
+    tasks_by_id = {task['id']: task for task in tasks}
+    task_id = get_valid_task_id(tasks_by_id)
+    print(f"Is the task (ID {task_id}) 1. In progress 2. Done")
+    while True:
+        status_choice = input("Enter your choice (1 or 2): ").strip()
+        if status_choice == '1':
+            new_status = 'in progress'
+            break
+        elif status_choice == '2':
+            new_status = 'done'
+            break
+        else:
+            logging.error(f"Invalid choice for task status: {status_choice}")
+            print("Error: Invalid choice. Please enter 1 or 2.")
+    
+    tasks_by_id[task_id]['status'] = new_status
+    if not save_tasks(tasks):
+        return
+    logging.info(f"Task ID {task_id} status updated to '{new_status}'")
+    print(f"Task ID {task_id} status updated to '{new_status}'.")
+
+# Update task title with input validation
+def update_task_title():
+    tasks = load_tasks()
+    tasks_by_id = {task['id']: task for task in tasks}
+    task_id = get_valid_task_id(tasks_by_id)
+    new_title = input("Enter new task title: ").strip()
+    if not new_title:
+        logging.error("Task title cannot be empty")
+        print("Error: Task title cannot be empty.")
+        return
+
+    tasks_by_id[task_id]['title'] = new_title
+    if not save_tasks(tasks):
+        return
+    logging.info(f"Task ID {task_id} title updated to '{new_title}'")
+    print(f"Task ID {task_id} title updated to '{new_title}'.")
+
+# Update task description with input validation
+def update_task_description():
+    tasks = load_tasks()
+    tasks_by_id = {task['id']: task for task in tasks}
+    task_id = get_valid_task_id(tasks_by_id)
+    new_description = input("Enter new task description: ").strip()
+    if not new_description:
+        logging.error("Task description cannot be empty")
+        print("Error: Task description cannot be empty.")
+        return
+
+    tasks_by_id[task_id]['description'] = new_description
+    if not save_tasks(tasks):
+        return
+    logging.info(f"Task ID {task_id} description updated")
+    print(f"Task ID {task_id} description updated.")
+
+# Back up the tasks file on user request
+def backup_tasks():
+    backup_file = create_backup()
+    if backup_file:
+        print(f"Backup created: {backup_file}")
+    else:
+        print("No changes since the last backup.")
+
+# Main function to handle user prompts and actions
+def main():
+    while True:
+        display_tasks()
+
+        print("\nChoose an action:")
+        print("1. Add a new task")
+        print("2. Update task status (In progress / Done)")
+        print("3. Change the title of a task")
+        print("4. Change the description of a task")
+        print("5. Back up tasks now")
+        print("6. Exit")
+
+        choice = input("\nEnter your choice (1-6): ").strip()
+
+        if choice == '1':
+            add_task()
+
+        elif choice == '2':
+            update_task_status()
+
+        elif choice == '3':
+            update_task_title()
+
+        elif choice == '4':
+            update_task_description()
+
+        elif choice == '5':
+            backup_tasks()
+
+        elif choice == '6':
+            logging.info("User exited the task tracker")
+            print("Exiting Task Tracker. Goodbye!")
+            break
+
+        else:
+            logging.warning(f"Invalid choice: {choice}")
+            print("Invalid choice. Please enter a number between 1 and 6.")
+
+# Parse command line options
+def parse_args():
+    parser = argparse.ArgumentParser(description="Encrypted command line task tracker.")
+    parser.add_argument("--key-file", action="store_true",
+                        help=f"load the encryption key from {KEY_FILE} (generated if missing) "
+                             "instead of the ENCRYPTION_KEY environment variable")
+    parser.add_argument("--no-log", action="store_true",
+                        help=f"do not record activity in {LOG_FILE}")
+    return parser.parse_args()
+
+if __name__ == "__main__":
+    args = parse_args()
+    _use_key_file = args.key_file
+    if args.no_log:
+        logging.disable(logging.CRITICAL)
+    else:
+        setup_logging()
+    logging.info("Task Tracker started")
+    # Check the key up front; creating an empty tasks file no longer touches the cipher
+    try:
+        get_cipher()
+    except ValueError as error:
+        logging.error(f"Encryption key could not be loaded: {error}")
+        print(f"Error: Encryption key could not be loaded: {error}")
+        sys.exit(1)
+    main()